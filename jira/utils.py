@@ -1,10 +1,13 @@
 # jira/utils.py
 
 import os
+import sys
 from functools import wraps
 
 from tqdm import tqdm
 
+from .logger import logger
+
 
 def progress_bar(iterable=None, desc=None, total=None, **kwargs):
     """
@@ -28,18 +31,84 @@ def progress_bar(iterable=None, desc=None, total=None, **kwargs):
     )
 
 
+class _NullPbar:
+    """No-op stand-in for tqdm when progress output would be pure overhead."""
+
+    total = None
+
+    def update(self, *args, **kwargs):
+        pass
+
+    def refresh(self):
+        pass
+
+    def close(self):
+        pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        return False
+
+
+class _LogPbar:
+    """
+    Progress counter that logs milestones instead of rendering a bar.
+
+    Used where tqdm's ANSI redraws are pointless (CI logs, pipes): counts
+    updates and emits one log line roughly every 5% of the total.
+    """
+
+    def __init__(self, desc=None, total=None):
+        self.desc = desc or "Progress"
+        self.total = total
+        self.n = 0
+        self._last_logged = 0
+
+    def update(self, n=1):
+        self.n += n
+        step = max(1, self.total // 20) if self.total else 100
+        if self.n - self._last_logged >= step or (self.total and self.n >= self.total):
+            self._last_logged = self.n
+            total = self.total if self.total is not None else "?"
+            logger.info(f"{self.desc}: {self.n}/{total}")
+
+    def refresh(self):
+        pass
+
+    def close(self):
+        pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        return False
+
+
 def with_progress(desc=None, total=None):
     """
     Decorator to add a progress bar to a function.
 
     :param desc: Description for the progress bar
     :param total: Total number of items (required for manual updates)
+
+    When there is nothing to count, a no-op progress bar is substituted.
+    When stderr is not a terminal or NO_TQDM is set, a logging counter
+    replaces tqdm so progress is still visible without per-update
+    terminal rendering.
     """
 
     def decorator(func):
         @wraps(func)
         async def wrapper(*args, **kwargs):
-            pbar = progress_bar(desc=desc, total=total)
+            if total == 0:
+                pbar = _NullPbar()
+            elif os.environ.get("NO_TQDM") or not sys.stderr.isatty():
+                pbar = _LogPbar(desc=desc, total=total)
+            else:
+                pbar = progress_bar(desc=desc, total=total)
             try:
                 result = await func(*args, **kwargs, pbar=pbar)
                 pbar.close()
@@ -55,19 +124,32 @@ def with_progress(desc=None, total=None):
 
 IMPORTED_PROJECTS_FILE = "jira/imported_projects.txt"
 
+# Parsed contents of IMPORTED_PROJECTS_FILE; None means not loaded yet
+_imported_projects_cache = None
+
 
 def mark_project_as_imported(project_id):
     with open(IMPORTED_PROJECTS_FILE, "a") as f:
         f.write(f"{project_id}\n")
+    if _imported_projects_cache is not None:
+        _imported_projects_cache.add(int(project_id))
 
 
 def get_imported_projects():
-    if not os.path.exists(IMPORTED_PROJECTS_FILE):
-        return set()
-    with open(IMPORTED_PROJECTS_FILE, "r") as f:
-        return set(int(line.strip()) for line in f if line.strip())
+    global _imported_projects_cache
+    if _imported_projects_cache is None:
+        if os.path.exists(IMPORTED_PROJECTS_FILE):
+            with open(IMPORTED_PROJECTS_FILE, "r") as f:
+                _imported_projects_cache = set(
+                    int(line.strip()) for line in f if line.strip()
+                )
+        else:
+            _imported_projects_cache = set()
+    return _imported_projects_cache
 
 
 def clear_imported_projects():
+    global _imported_projects_cache
     if os.path.exists(IMPORTED_PROJECTS_FILE):
         os.remove(IMPORTED_PROJECTS_FILE)
+    _imported_projects_cache = set()
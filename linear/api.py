@@ -1,16 +1,28 @@
 # linear/api.py
 import asyncio
-import uuid
 from typing import Any, Dict, List
 
 import aiohttp
+from aiolimiter import AsyncLimiter
 from gql import Client, gql
 from gql.transport.aiohttp import AIOHTTPTransport
+from gql.transport.exceptions import TransportServerError
+
+try:
+    import orjson
+
+    def json_serialize(obj):
+        return orjson.dumps(obj).decode()
+
+except ImportError:
+    import json
+
+    json_serialize = json.dumps
 
 from .config import Config
 from .exceptions import LinearAPIError
 from .logger import logger
-from .utils import chunk_list, retry_async
+from .utils import retry_async
 
 
 class LinearAPI:
@@ -19,27 +31,65 @@ class LinearAPI:
         self.token = Config.LINEAR_API_KEY
         self.client = None
         self.semaphore = asyncio.Semaphore(Config.MAX_CONCURRENT_REQUESTS)
+        # The semaphore bounds in-flight requests; the token bucket bounds
+        # sustained request rate so parallel migrations don't trip Linear's
+        # rate limits and burn time in throttled retries.
+        self.limiter = AsyncLimiter(Config.MAX_REQUESTS_PER_SECOND, time_period=1)
+        self._client_lock = asyncio.Lock()
+        # Memoize label creation per (team_id, label, is_epic). The cache
+        # stores the in-flight task, so concurrent callers asking for the
+        # same label share a single request instead of racing N of them.
+        self._label_cache = {}
 
     async def __aenter__(self):
-        transport = AIOHTTPTransport(
-            url=self.url, headers={"Authorization": self.token}
-        )
-        self.client = Client(transport=transport, fetch_schema_from_transport=True)
+        # Client construction is deferred to the first query so entering
+        # the context repeatedly stays free.
         return self
 
     async def __aexit__(self, exc_type, exc, tb):
-        await self.client.transport.close()
+        await self.close()
+
+    async def _ensure_client(self) -> Client:
+        """Build the transport and client once, on first use."""
+        if self.client is None:
+            async with self._client_lock:
+                if self.client is None:
+                    transport = AIOHTTPTransport(
+                        url=self.url,
+                        headers={"Authorization": self.token},
+                        json_serialize=json_serialize,
+                        client_session_args={"json_serialize": json_serialize},
+                    )
+                    # All queries are hand-written, so skip the expensive
+                    # schema introspection round trip on construction.
+                    self.client = Client(
+                        transport=transport, fetch_schema_from_transport=False
+                    )
+        return self.client
+
+    async def close(self):
+        """Tear down the transport and connection pool, if one was built."""
+        if self.client is not None:
+            await self.client.transport.close()
+            self.client = None
+
+    # Retry transient transport failures only; GraphQL validation errors
+    # and other client mistakes surface immediately.
+    @retry_async(
+        max_retries=3,
+        retry_on=(asyncio.TimeoutError, aiohttp.ClientError, TransportServerError),
+    )
+    async def _execute(self, query: str, variables: Dict = None) -> Dict:
+        client = await self._ensure_client()
+        async with self.limiter, self.semaphore:
+            return await client.execute_async(gql(query), variable_values=variables)
 
-    @retry_async(max_retries=3)
     async def execute_query(self, query: str, variables: Dict = None) -> Dict:
-        async with self.semaphore:
-            try:
-                return await self.client.execute_async(
-                    gql(query), variable_values=variables
-                )
-            except Exception as e:
-                logger.error(f"API request failed: {str(e)}")
-                raise LinearAPIError(f"API request failed: {str(e)}")
+        try:
+            return await self._execute(query, variables)
+        except Exception as e:
+            logger.error(f"API request failed: {str(e)}")
+            raise LinearAPIError(f"API request failed: {str(e)}")
 
     async def create_team(self, name: str, key: str, description: str = None) -> Dict:
         query = """
@@ -108,8 +158,8 @@ class LinearAPI:
         self, team_id: str, title: str, description: str = None, **kwargs
     ) -> Dict:
         query = """
-        mutation CreateIssue($teamId: String!, $title: String!, $description: String, $assigneeId: String, $projectId: String, $cycleId: String, $parentId: String, $priority: Int, $estimate: Float, $labelIds: [String!]) {
-          issueCreate(input: {teamId: $teamId, title: $title, description: $description, assigneeId: $assigneeId, projectId: $projectId, cycleId: $cycleId, parentId: $parentId, priority: $priority, estimate: $estimate, labelIds: $labelIds}) {
+        mutation CreateIssue($teamId: String!, $title: String!, $description: String, $stateId: String, $assigneeId: String, $projectId: String, $cycleId: String, $parentId: String, $priority: Int, $estimate: Float, $labelIds: [String!]) {
+          issueCreate(input: {teamId: $teamId, title: $title, description: $description, stateId: $stateId, assigneeId: $assigneeId, projectId: $projectId, cycleId: $cycleId, parentId: $parentId, priority: $priority, estimate: $estimate, labelIds: $labelIds}) {
             success
             issue {
               id
@@ -135,6 +185,39 @@ class LinearAPI:
         result = await self.execute_query(query, variables)
         return result["issueCreate"]["issue"]
 
+    async def create_issues(self, issue_inputs: List[Dict]) -> List[Dict]:
+        """
+        Create multiple issues in one request using aliased issueCreate
+        mutations, amortizing the HTTP and GraphQL parse overhead.
+
+        :param issue_inputs: List of IssueCreateInput dicts (camelCase keys)
+        :return: List of created issue dicts, in input order
+        """
+        if not issue_inputs:
+            return []
+
+        variable_defs = ", ".join(
+            f"$input{i}: IssueCreateInput!" for i in range(len(issue_inputs))
+        )
+        mutation_fields = "\n".join(
+            f"""
+          i{i}: issueCreate(input: $input{i}) {{
+            success
+            issue {{
+              id
+              title
+              description
+            }}
+          }}"""
+            for i in range(len(issue_inputs))
+        )
+        query = f"mutation CreateIssues({variable_defs}) {{{mutation_fields}\n}}"
+        variables = {
+            f"input{i}": issue_input for i, issue_input in enumerate(issue_inputs)
+        }
+        result = await self.execute_query(query, variables)
+        return [result[f"i{i}"]["issue"] for i in range(len(issue_inputs))]
+
     async def update_issue(self, issue_id: str, data: Dict[str, Any]) -> Dict:
         query = """
         mutation UpdateIssue($id: String!, $input: IssueUpdateInput!) {
@@ -171,6 +254,41 @@ class LinearAPI:
         result = await self.execute_query(query, variables)
         return result["commentCreate"]["comment"]
 
+    async def create_comments(self, comments: List[Dict]) -> List[Dict]:
+        """
+        Create multiple comments in one request using aliased commentCreate
+        mutations, amortizing the HTTP and GraphQL parse overhead.
+
+        :param comments: List of dicts with "issue_id" and "body" keys
+        :return: List of created comment dicts, in input order
+        """
+        if not comments:
+            return []
+
+        variable_defs = ", ".join(
+            f"$input{i}: CommentCreateInput!" for i in range(len(comments))
+        )
+        mutation_fields = "\n".join(
+            f"""
+          c{i}: commentCreate(input: $input{i}) {{
+            success
+            comment {{
+              id
+              body
+              user {{ id }}
+              createdAt
+            }}
+          }}"""
+            for i in range(len(comments))
+        )
+        query = f"mutation CreateComments({variable_defs}) {{{mutation_fields}\n}}"
+        variables = {
+            f"input{i}": {"issueId": comment["issue_id"], "body": comment["body"]}
+            for i, comment in enumerate(comments)
+        }
+        result = await self.execute_query(query, variables)
+        return [result[f"c{i}"]["comment"] for i in range(len(comments))]
+
     async def create_attachment(self, issue_id: str, url: str, title: str) -> Dict:
         query = """
         mutation CreateAttachment($issueId: String!, $url: String!, $title: String!) {
@@ -272,6 +390,19 @@ class LinearAPI:
     async def get_or_create_label(
         self, team_id: str, label: str, is_epic: bool
     ) -> Dict:
+        cache_key = (team_id, label, is_epic)
+        task = self._label_cache.get(cache_key)
+        if task is None:
+            task = asyncio.ensure_future(self._create_label(team_id, label, is_epic))
+            self._label_cache[cache_key] = task
+        try:
+            return await task
+        except Exception:
+            # Don't cache failures; let a later call retry the creation.
+            self._label_cache.pop(cache_key, None)
+            raise
+
+    async def _create_label(self, team_id: str, label: str, is_epic: bool) -> Dict:
         query = """
         mutation IssueLabelCreate($issueLabelCreateInput: IssueLabelCreateInput!) {
           issueLabelCreate(input: $issueLabelCreateInput) {
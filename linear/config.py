@@ -16,27 +16,8 @@ class Config:
     # User mapping, pt user id -> linear user object
     LINEAR_USER_MAP = {}  # Will be populated during migration
 
-    # Workflow state mapping (PT state -> Linear state)
-    WORKFLOW_STATE_MAP = {
-        "unstarted": "Todo",
-        "started": "In Progress",
-        "finished": "In Review",
-        "delivered": "Done",
-        "accepted": "Done",
-        "rejected": "Todo",
-    }
-
-    # Issue type mapping (PT type -> Linear type)
-    ISSUE_TYPE_MAP = {"feature": "Feature", "bug": "Bug", "chore": "Task"}
-
-    # Priority mapping (PT -> Linear)
-    PRIORITY_MAP = {
-        "p0": 1,  # Urgent
-        "p1": 2,  # High
-        "p2": 3,  # Medium
-        "p3": 4,  # Low
-        "p4": 0,  # No priority
-    }
+    # The PT -> Linear state/type/priority mapping tables live next to the
+    # map_* helpers in linear/utils.py
 
     # Base directory for attachments (shared with PT and JIRA code)
     BASE_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", ".."))
@@ -45,6 +26,12 @@ class Config:
     # Maximum number of concurrent API requests
     MAX_CONCURRENT_REQUESTS = 5
 
+    # Sustained API request rate limit (requests per second)
+    MAX_REQUESTS_PER_SECOND = 25
+
+    # Maximum number of projects migrated concurrently
+    MAX_CONCURRENT_PROJECTS = 3
+
     # Batch size for bulk operations
     BATCH_SIZE = 50
 
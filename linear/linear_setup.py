@@ -5,6 +5,7 @@ from .config import Config
 from .exceptions import ConfigurationError
 from .logger import logger
 from .models import LinearWorkflowState
+from .utils import semaphore_gather
 
 
 class LinearSetup:
@@ -30,24 +31,42 @@ class LinearSetup:
         existing_states = await self.linear_api.get_workflow_states(team_id)
         existing_state_names = {state["name"].lower() for state in existing_states}
 
-        for state_name, state_type, color_code in required_states:
-            if state_name.lower() not in existing_state_names:
-                try:
-                    new_state = await self.linear_api.create_workflow_state(
-                        team_id,
-                        state_name,
-                        state_type,
-                        color_code,
-                        f"PT {state_name.lower()} state",
-                    )
-                    logger.info(f"Created new workflow state: {state_name}")
-                except Exception as e:
-                    logger.error(
-                        f"Failed to create workflow state {state_name}: {str(e)}"
-                    )
-                    raise ConfigurationError(
-                        f"Failed to create workflow state {state_name}: {str(e)}"
-                    )
+        # Create all missing states concurrently, bounded so large fan-outs
+        # can't swamp the Linear API.
+        missing_states = [
+            (state_name, state_type, color_code)
+            for state_name, state_type, color_code in required_states
+            if state_name.lower() not in existing_state_names
+        ]
+
+        results = await semaphore_gather(
+            Config.MAX_CONCURRENT_REQUESTS,
+            *(
+                self.linear_api.create_workflow_state(
+                    team_id,
+                    state_name,
+                    state_type,
+                    color_code,
+                    f"PT {state_name.lower()} state",
+                )
+                for state_name, state_type, color_code in missing_states
+            ),
+        )
+
+        failed_states = []
+        for (state_name, _, _), result in zip(missing_states, results):
+            if isinstance(result, Exception):
+                logger.error(
+                    f"Failed to create workflow state {state_name}: {str(result)}"
+                )
+                failed_states.append(state_name)
+            else:
+                logger.info(f"Created new workflow state: {state_name}")
+
+        if failed_states:
+            raise ConfigurationError(
+                f"Failed to create workflow states: {', '.join(failed_states)}"
+            )
 
         logger.info("Workflow states setup completed")
 
@@ -97,14 +116,19 @@ class LinearSetup:
         """
         logger.info(f"Setting up labels for team {team_id}")
 
-        for label_name, is_epic in pt_labels:
-            try:
-                label = await self.linear_api.get_or_create_label(
-                    team_id, label_name, is_epic
-                )
-                logger.info(f"Created or found label: {label_name}")
-            except Exception as e:
-                logger.error(f"Failed to create label {label_name}: {str(e)}")
+        results = await semaphore_gather(
+            Config.MAX_CONCURRENT_REQUESTS,
+            *(
+                self.linear_api.get_or_create_label(team_id, label_name, is_epic)
+                for label_name, is_epic in pt_labels
+            ),
+        )
+
+        for (label_name, _), result in zip(pt_labels, results):
+            if isinstance(result, Exception):
+                logger.error(f"Failed to create label {label_name}: {str(result)}")
                 # Continue with the next label instead of raising an exception
+            else:
+                logger.info(f"Created or found label: {label_name}")
 
         logger.info("Labels setup completed")
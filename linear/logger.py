@@ -28,21 +28,23 @@ class CustomFormatter(logging.Formatter):
     red = "\x1b[31;20m"
     bold_red = "\x1b[31;1m"
     reset = "\x1b[0m"
-    format = (
+    # Named _FMT so the string isn't shadowed by the format() method below.
+    _FMT = (
         "%(asctime)s - %(name)s - %(levelname)s - %(message)s (%(filename)s:%(lineno)d)"
     )
 
+    # One Formatter per level, built once, so formatting a record is a
+    # single dict lookup with no per-record string concatenation.
     FORMATS = {
-        logging.DEBUG: grey + format + reset,
-        logging.INFO: grey + format + reset,
-        logging.WARNING: yellow + format + reset,
-        logging.ERROR: red + format + reset,
-        logging.CRITICAL: bold_red + format + reset,
+        logging.DEBUG: logging.Formatter(grey + _FMT + reset),
+        logging.INFO: logging.Formatter(grey + _FMT + reset),
+        logging.WARNING: logging.Formatter(yellow + _FMT + reset),
+        logging.ERROR: logging.Formatter(red + _FMT + reset),
+        logging.CRITICAL: logging.Formatter(bold_red + _FMT + reset),
     }
 
     def format(self, record):
-        log_fmt = self.FORMATS.get(record.levelno)
-        formatter = logging.Formatter(log_fmt)
+        formatter = self.FORMATS.get(record.levelno, self.FORMATS[logging.INFO])
         return formatter.format(record)
 
 
@@ -73,40 +75,3 @@ def setup_logger(name, log_file=None, level=logging.INFO):
 timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
 log_file = f"logs/linear_migration_{timestamp}.log"
 logger = setup_logger("linear_migration", log_file)
-
-
-def progress_bar(iterable=None, desc=None, total=None, **kwargs):
-    """
-    Create a progress bar for an iterable or manual updates.
-    """
-    return tqdm(
-        iterable=iterable,
-        desc=desc,
-        total=total,
-        ncols=100,
-        unit="item",
-        unit_scale=True,
-        bar_format="{l_bar}{bar}| {n_fmt}/{total_fmt} [{elapsed}<{remaining}]",
-        **kwargs,
-    )
-
-
-def with_progress(desc=None, total=None):
-    """
-    Decorator to add a progress bar to a function.
-    """
-
-    def decorator(func):
-        async def wrapper(*args, **kwargs):
-            pbar = progress_bar(desc=desc, total=total)
-            try:
-                result = await func(*args, **kwargs, pbar=pbar)
-                pbar.close()
-                return result
-            except Exception as e:
-                pbar.close()
-                raise e
-
-        return wrapper
-
-    return decorator
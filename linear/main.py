@@ -3,12 +3,20 @@
 import asyncio
 from typing import List, Optional
 
+try:
+    import uvloop
+
+    uvloop.install()
+except ImportError:
+    # uvloop is optional; the stock event loop works too, just slower
+    uvloop = None
+
 import click
-from sqlalchemy.orm import joinedload
+from sqlalchemy.orm import raiseload, selectinload
 from tqdm import tqdm
 
 from database import get_db, init_db
-from models import Comment, Epic, Iteration, Label, Person, Project, Story
+from models import Blocker, Comment, Epic, Iteration, Label, Person, Project, Story
 
 from .api import LinearAPI
 from .config import Config
@@ -24,8 +32,10 @@ from .migrators.team_migrator import TeamMigrator
 from .migrators.user_migrator import UserMigrator
 from .utils import (
     clear_processed_teams,
+    close_processed_teams_file,
     get_processed_teams,
     mark_team_as_processed,
+    semaphore_gather,
     with_progress,
 )
 
@@ -110,23 +120,40 @@ class MigrationOrchestrator:
 
             # Migrate stories as issues
             await self.issue_migrator.migrate_issues(
-                pt_project.stories, linear_team.id, pt_project.id
+                pt_project.stories, linear_team.id, pt_project
             )
             if pbar:
                 pbar.update(1)
 
-            # Migrate comments and attachments
-            for pt_story in pt_project.stories:
-                linear_issue = self.issue_migrator.get_linear_issue(pt_story.id)
-                if linear_issue:
-                    await self.comment_migrator.migrate_comments(
+            # Walk the story collection once: the (story, issue) pairs feed
+            # both the comment and the relation phases below.
+            story_issue_pairs = [
+                (pt_story, linear_issue)
+                for pt_story in pt_project.stories
+                if (linear_issue := self.issue_migrator.get_linear_issue(pt_story.id))
+            ]
+
+            # Migrate comments and attachments concurrently across stories,
+            # skipping stories with nothing to migrate so no no-op
+            # coroutines get scheduled.
+            results = await semaphore_gather(
+                Config.MAX_CONCURRENT_REQUESTS,
+                *(
+                    self.comment_migrator.migrate_comments(
                         pt_story.comments, linear_issue.id
                     )
+                    for pt_story, linear_issue in story_issue_pairs
+                    if pt_story.comments
+                ),
+            )
+            for result in results:
+                if isinstance(result, Exception):
+                    logger.error(f"Comment migration failed: {str(result)}")
             if pbar:
                 pbar.update(1)
 
             # Migrate relations (blockers)
-            await self.relation_migrator.migrate_relations(pt_project.stories)
+            await self.relation_migrator.migrate_relations(story_issue_pairs)
             if pbar:
                 pbar.update(1)
 
@@ -145,30 +172,51 @@ class MigrationOrchestrator:
 
 async def get_pt_projects(project_ids: Optional[List[int]] = None):
     """
-    Retrieve Pivotal Tracker projects from the database.
+    Stream Pivotal Tracker projects from the database.
+
+    Projects are yielded in chunks rather than materialized all at once,
+    so --all migrations don't hold every story, comment and attachment
+    object in memory at the same time.
 
     :param project_ids: Optional list of project IDs to retrieve
-    :return: List of Project objects with related data
+    :return: Async generator of Project objects with related data
     """
     with get_db() as db:
+        # selectinload issues one IN-query per collection instead of the
+        # cartesian row explosion that stacked joinedloads produce.
         query = db.query(Project).options(
-            joinedload(Project.members),
-            joinedload(Project.stories).joinedload(Story.labels),
-            joinedload(Project.stories)
-            .joinedload(Story.comments)
-            .joinedload(Comment.file_attachments),
-            joinedload(Project.stories).joinedload(Story.owners),
-            joinedload(Project.stories).joinedload(Story.blockers),
-            joinedload(Project.iterations),
-            joinedload(Project.epics),
+            selectinload(Project.members),
+            selectinload(Project.stories).selectinload(Story.labels),
+            selectinload(Project.stories)
+            .selectinload(Story.comments)
+            .selectinload(Comment.file_attachments),
+            selectinload(Project.stories).selectinload(Story.owners),
+            # Blocker.story is walked by the relation migrator; load it
+            # here so blockers don't trigger one SELECT per story access.
+            selectinload(Project.stories)
+            .selectinload(Story.blockers)
+            .selectinload(Blocker.story),
+            selectinload(Project.stories).selectinload(Story.iteration),
+            selectinload(Project.stories).selectinload(Story.tasks),
+            selectinload(Project.iterations),
+            selectinload(Project.epics),
+            # Anything not eager-loaded above fails fast instead of
+            # silently lazy-loading; migrators only see detached objects.
+            raiseload("*"),
         )
 
         if project_ids:
             query = query.filter(Project.id.in_(project_ids))
 
-        projects = query.all()
-        db.expunge_all()
-        return projects
+        # yield_per streams result chunks; compatible with selectinload,
+        # unlike joinedload collections.
+        for project in query.yield_per(50):
+            # Detach the whole loaded graph (members, stories, comments,
+            # ...), not just the Project row: migrations may still be
+            # running when the session commits and closes, and commit
+            # would expire any instance left bound to it.
+            db.expunge_all()
+            yield project
 
 
 async def run_migration(
@@ -178,19 +226,17 @@ async def run_migration(
 ):
     async with LinearAPI() as linear_api:
         try:
-            orchestrator = MigrationOrchestrator(linear_api)
-
             # Run global setup once
-            await orchestrator.run_global_setup()
+            await LinearSetup(linear_api).run_global_setup()
 
-            # Get projects to migrate
-            if migrate_all:
-                pt_projects = await get_pt_projects()
-            else:
-                pt_projects = await get_pt_projects(project_ids)
+            sem = asyncio.Semaphore(Config.MAX_CONCURRENT_PROJECTS)
+            pbar = tqdm(desc="Migrating Projects", unit="project", mininterval=0.25)
 
-            for pt_project in tqdm(pt_projects, desc="Migrating Projects"):
+            async def migrate_one(pt_project):
+                # Orchestrator state (issue_map, cycle_map, ...) is
+                # per-project, so each project gets its own instance.
                 try:
+                    orchestrator = MigrationOrchestrator(linear_api)
                     linear_team = await orchestrator.migrate_project(
                         pt_project, force_update
                     )
@@ -202,6 +248,25 @@ async def run_migration(
                     logger.error(
                         f"Migration failed for project {pt_project.name}: {str(e)}"
                     )
+                finally:
+                    sem.release()
+                    pbar.update(1)
+
+            try:
+                async with asyncio.TaskGroup() as tg:
+                    # Migrate projects as they stream in from the database.
+                    # Acquiring the semaphore *before* creating each task
+                    # pauses the generator once MAX_CONCURRENT_PROJECTS are
+                    # in flight, so only that many project object graphs
+                    # are held in memory at a time.
+                    async for pt_project in get_pt_projects(
+                        None if migrate_all else list(project_ids)
+                    ):
+                        await sem.acquire()
+                        tg.create_task(migrate_one(pt_project))
+            finally:
+                pbar.close()
+                close_processed_teams_file()
 
         except Exception as e:
             logger.error(f"An error occurred during migration: {str(e)}")
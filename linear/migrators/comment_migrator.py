@@ -1,13 +1,13 @@
 # linear/migrators/comment_migrator.py
 
+import asyncio
 import os
 
 from ..api import LinearAPI
 from ..config import Config
 from ..exceptions import CommentMigrationError
 from ..logger import logger
-from ..models import LinearAttachment, LinearComment
-from ..utils import with_progress
+from ..utils import chunk_list, semaphore_gather, with_progress
 
 
 class CommentMigrator:
@@ -32,15 +32,42 @@ class CommentMigrator:
 
         migrated_comments = []
 
-        for pt_comment in pt_comments:
+        # Create comments in batches of aliased mutations: one HTTP request
+        # per BATCH_SIZE comments instead of one per comment.
+        for chunk in chunk_list(pt_comments, Config.BATCH_SIZE):
+            payload = [
+                {
+                    "issue_id": linear_issue_id,
+                    "body": f"[Migrated from Pivotal Tracker]\n\n{pt_comment.text}",
+                }
+                for pt_comment in chunk
+            ]
             try:
-                linear_comment = await self.migrate_comment(pt_comment, linear_issue_id)
-                migrated_comments.append(linear_comment.id)
+                created_comments = await self.linear_api.create_comments(payload)
+                migrated_comments.extend(comment["id"] for comment in created_comments)
+            except Exception as e:
+                logger.warning(
+                    f"Failed to migrate comment batch for issue {linear_issue_id}: {str(e)}"
+                )
+                # Continue with the next batch
                 if pbar:
-                    pbar.update(1)
-            except CommentMigrationError as e:
-                logger.warning(f"Failed to migrate comment {pt_comment.id}: {str(e)}")
-                # Continue with the next comment
+                    pbar.update(len(chunk))
+                continue
+
+            # Attachments still upload individually, concurrently per batch
+            await semaphore_gather(
+                Config.MAX_CONCURRENT_REQUESTS,
+                *(
+                    self.migrate_attachments(
+                        pt_comment.file_attachments, linear_issue_id
+                    )
+                    for pt_comment in chunk
+                    if pt_comment.file_attachments
+                ),
+            )
+
+            if pbar:
+                pbar.update(len(chunk))
 
         logger.info(
             f"Comment migration completed. Migrated {len(migrated_comments)} comments"
@@ -53,15 +80,11 @@ class CommentMigrator:
 
         :param pt_comment: Pivotal Tracker comment object from the database
         :param linear_issue_id: ID of the Linear issue to add the comment to
-        :return: LinearComment object
+        :return: ID of the created Linear comment
         """
         logger.info(f"Migrating comment: {pt_comment.id}")
 
         try:
-            # Get the Linear user ID for the comment author
-            linear_user = self.user_migrator.get_linear_user(pt_comment.person_id)
-            user_id = linear_user.id if linear_user else None
-
             # Prepare the comment body
             comment_body = f"[Migrated from Pivotal Tracker]\n\n{pt_comment.text}"
 
@@ -70,22 +93,14 @@ class CommentMigrator:
                 issue_id=linear_issue_id, body=comment_body
             )
 
-            # Create LinearComment object
-            linear_comment = LinearComment(
-                id=linear_comment_data["id"],
-                body=linear_comment_data["body"],
-                user_id=user_id,
-                created_at=pt_comment.created_at,
-                issue_id=linear_issue_id,
-            )
-
             # Handle attachments
             if pt_comment.file_attachments:
                 await self.migrate_attachments(
                     pt_comment.file_attachments, linear_issue_id
                 )
 
-            return linear_comment
+            # Callers only need the ID; skip the wrapper allocation
+            return linear_comment_data["id"]
 
         except Exception as e:
             raise CommentMigrationError(
@@ -99,34 +114,46 @@ class CommentMigrator:
         :param pt_attachments: List of Pivotal Tracker attachment objects
         :param linear_issue_id: ID of the Linear issue to add attachments to
         """
-        for pt_attachment in pt_attachments:
-            try:
-                # Construct the full file path
-                file_path = Config.get_attachment_path(pt_attachment.file_path)
-
-                # Check if the file exists
-                if not os.path.exists(file_path):
-                    logger.warning(f"Attachment file not found: {file_path}")
-                    continue
-
-                # Create the attachment in Linear
-                linear_attachment_data = await self.linear_api.create_attachment(
-                    issue_id=linear_issue_id,
-                    title=pt_attachment.filename,
-                    url=file_path,  # Linear API will handle the file upload
-                )
+        results = await semaphore_gather(
+            Config.MAX_CONCURRENT_REQUESTS,
+            *(
+                self.migrate_attachment(pt_attachment, linear_issue_id)
+                for pt_attachment in pt_attachments
+            ),
+        )
 
-                # Create LinearAttachment object
-                linear_attachment = LinearAttachment(
-                    id=linear_attachment_data["id"],
-                    title=linear_attachment_data["title"],
-                    url=linear_attachment_data["url"],
-                    issue_id=linear_issue_id,
+        for pt_attachment, result in zip(pt_attachments, results):
+            if isinstance(result, Exception):
+                logger.warning(
+                    f"Failed to migrate attachment {pt_attachment.filename}: {str(result)}"
                 )
 
-                logger.info(f"Migrated attachment: {linear_attachment.title}")
+    async def migrate_attachment(self, pt_attachment, linear_issue_id):
+        """
+        Migrate a single Pivotal Tracker attachment to Linear.
 
-            except Exception as e:
-                logger.warning(
-                    f"Failed to migrate attachment {pt_attachment.filename}: {str(e)}"
-                )
+        :param pt_attachment: Pivotal Tracker attachment object
+        :param linear_issue_id: ID of the Linear issue to add the attachment to
+        :return: ID of the created Linear attachment, or None if the file is missing
+        """
+        # Construct the full file path. The ETL stores file_path relative
+        # to the attachments dir as <project_id>/<story_id>/<id>_<filename>
+        # (the attachment ID prefix keeps duplicate names apart), so the
+        # base dir is all that's missing.
+        file_path = os.path.join(Config.ATTACHMENT_DIR, pt_attachment.file_path)
+
+        # Check if the file exists without blocking the event loop
+        if not await asyncio.to_thread(os.path.exists, file_path):
+            logger.warning(f"Attachment file not found: {file_path}")
+            return None
+
+        # Create the attachment in Linear
+        linear_attachment_data = await self.linear_api.create_attachment(
+            issue_id=linear_issue_id,
+            title=pt_attachment.filename,
+            url=file_path,  # Linear API will handle the file upload
+        )
+
+        logger.info(f"Migrated attachment: {pt_attachment.filename}")
+
+        return linear_attachment_data["id"]
@@ -1,17 +1,20 @@
 # linear/migrators/cycle_migrator.py
 
+import asyncio
+
 from ..api import LinearAPI
+from ..config import Config
 from ..exceptions import CycleMigrationError
 from ..logger import logger
-from ..models import LinearCycle
-from ..utils import with_progress
+from ..utils import semaphore_gather, with_progress
 
 
 class CycleMigrator:
     def __init__(self, linear_api: LinearAPI):
         self.linear_api = linear_api
         self.pt_project = None
-        self.cycle_map = {}  # Map PT iteration numbers to Linear cycle objects
+        self.cycle_map = {}  # Map PT iteration numbers to Linear cycle dicts
+        self._locks = {}  # Per-iteration locks so concurrent ensures migrate once
 
     @with_progress(desc="Migrating Iterations to Cycles")
     async def migrate_cycles(
@@ -23,7 +26,7 @@ class CycleMigrator:
         :param pt_iterations: List of Pivotal Tracker iteration objects from the database
         :param linear_team_id: ID of the Linear team to create cycles in
         :param pbar: Progress bar object
-        :return: Dictionary mapping PT iteration numbers to Linear cycle objects
+        :return: Dictionary mapping PT iteration numbers to Linear cycle dicts
         """
         logger.info(f"Starting migration for {len(pt_iterations)} iterations to cycles")
         if pbar:
@@ -32,17 +35,25 @@ class CycleMigrator:
 
         self.pt_project = pt_project
 
-        for pt_iteration in pt_iterations:
-            try:
-                linear_cycle = await self.migrate_cycle(pt_iteration, linear_team_id)
-                self.cycle_map[pt_iteration.number] = linear_cycle
-                if pbar:
-                    pbar.update(1)
-            except CycleMigrationError as e:
+        # Iterations are independent; create the cycles concurrently
+        results = await semaphore_gather(
+            Config.MAX_CONCURRENT_REQUESTS,
+            *(
+                self.migrate_cycle(pt_iteration, linear_team_id)
+                for pt_iteration in pt_iterations
+            ),
+        )
+
+        for pt_iteration, result in zip(pt_iterations, results):
+            if isinstance(result, Exception):
                 logger.warning(
-                    f"Failed to migrate iteration {pt_iteration.number}: {str(e)}"
+                    f"Failed to migrate iteration {pt_iteration.number}: {str(result)}"
                 )
                 # Continue with the next iteration
+            else:
+                self.cycle_map[pt_iteration.number] = result
+            if pbar:
+                pbar.update(1)
 
         logger.info(f"Cycle migration completed. Migrated {len(self.cycle_map)} cycles")
         return self.cycle_map
@@ -53,12 +64,13 @@ class CycleMigrator:
 
         :param pt_iteration: Pivotal Tracker iteration object from the database
         :param linear_team_id: ID of the Linear team to create the cycle in
-        :return: LinearCycle object
+        :return: Linear cycle dict as returned by the API
         """
         logger.info(f"Migrating iteration to cycle: {pt_iteration.number}")
 
         try:
-            # Create the cycle in Linear
+            # Create the cycle in Linear. Consumers only read "id", so the
+            # API response dict is kept as-is instead of re-wrapping it.
             linear_cycle_data = await self.linear_api.create_cycle(
                 team_id=linear_team_id,
                 name=f"{self.pt_project.name} - Iteration {pt_iteration.number}",
@@ -66,17 +78,7 @@ class CycleMigrator:
                 end_date=pt_iteration.finish.isoformat(),
             )
 
-            # Create LinearCycle object
-            linear_cycle = LinearCycle(
-                id=linear_cycle_data["id"],
-                number=linear_cycle_data["number"],
-                name=linear_cycle_data["name"],
-                start_date=linear_cycle_data["startDate"],
-                end_date=linear_cycle_data["endDate"],
-                team_id=linear_team_id,
-            )
-
-            return linear_cycle
+            return linear_cycle_data
 
         except Exception as e:
             raise CycleMigrationError(
@@ -85,10 +87,10 @@ class CycleMigrator:
 
     def get_linear_cycle(self, pt_iteration_number):
         """
-        Get the Linear cycle object for a given Pivotal Tracker iteration number.
+        Get the Linear cycle dict for a given Pivotal Tracker iteration number.
 
         :param pt_iteration_number: Pivotal Tracker iteration number
-        :return: LinearCycle object or None if not found
+        :return: Linear cycle dict or None if not found
         """
         return self.cycle_map.get(pt_iteration_number)
 
@@ -98,9 +100,18 @@ class CycleMigrator:
 
         :param pt_iteration: Pivotal Tracker iteration object
         :param linear_team_id: ID of the Linear team to create the cycle in
-        :return: LinearCycle object
+        :return: Linear cycle dict
         """
-        if pt_iteration.number not in self.cycle_map:
-            linear_cycle = await self.migrate_cycle(pt_iteration, linear_team_id)
-            self.cycle_map[pt_iteration.number] = linear_cycle
-        return self.cycle_map[pt_iteration.number]
+        linear_cycle = self.cycle_map.get(pt_iteration.number)
+        if linear_cycle is not None:
+            return linear_cycle
+
+        # Double-check under a per-iteration lock so concurrent callers
+        # racing on the same iteration don't create duplicate cycles
+        lock = self._locks.setdefault(pt_iteration.number, asyncio.Lock())
+        async with lock:
+            linear_cycle = self.cycle_map.get(pt_iteration.number)
+            if linear_cycle is None:
+                linear_cycle = await self.migrate_cycle(pt_iteration, linear_team_id)
+                self.cycle_map[pt_iteration.number] = linear_cycle
+            return linear_cycle
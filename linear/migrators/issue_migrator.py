@@ -1,6 +1,6 @@
 # linear/migrators/issue_migrator.py
 
-from database import get_db
+import asyncio
 
 from ..api import LinearAPI
 from ..config import Config
@@ -8,10 +8,12 @@ from ..exceptions import IssueMigrationError
 from ..logger import logger
 from ..models import LinearIssue, LinearWorkflowState
 from ..utils import (
+    chunk_list,
     map_issue_type,
     map_priority,
     map_state,
     sanitize_name,
+    semaphore_gather,
     with_progress,
 )
 
@@ -32,17 +34,19 @@ class IssueMigrator:
         self.cycle_migrator = cycle_migrator
         self.issue_map = {}  # Map PT story IDs to Linear issue objects
         self.workflow_states = {}  # Cache for workflow states
+        self._workflow_states_by_team = {}  # Cache keyed by Linear team ID
         self.label_epic_map = {}  # Map label IDs to epic IDs
+        self.user_id_map = {}  # Map PT user IDs to Linear user IDs
+        self._locks = {}  # Per-story locks so concurrent ensures migrate once
 
     @with_progress(desc="Migrating Issues")
-    async def migrate_issues(
-        self, pt_stories, linear_team_id, pt_project_id, pbar=None
-    ):
+    async def migrate_issues(self, pt_stories, linear_team_id, pt_project, pbar=None):
         """
         Migrate a list of Pivotal Tracker stories to Linear issues.
 
         :param pt_stories: List of Pivotal Tracker story objects from the database
         :param linear_team_id: ID of the Linear team to create issues in
+        :param pt_project: Pivotal Tracker project object with epics eager-loaded
         :param pbar: Progress bar object
         :return: Dictionary mapping PT story IDs to Linear issue objects
         """
@@ -51,28 +55,173 @@ class IssueMigrator:
             pbar.total = len(pt_stories)
             pbar.refresh()
 
-        self.label_epic_map = await get_label_epic_map(pt_project_id)
+        # Epics are already eager-loaded by get_pt_projects; build the map
+        # in memory instead of re-querying the database per project.
+        self.label_epic_map = {epic.label_id: epic.id for epic in pt_project.epics}
+
+        # Resolve every referenced user once up front so the per-story
+        # builders do plain dict hits instead of per-field migrator calls.
+        self._prefetch_users(pt_stories)
 
         # Fetch and cache workflow states
         await self.fetch_workflow_states(linear_team_id)
 
-        for pt_story in pt_stories:
+        # Create issues in batches of aliased mutations: one HTTP request
+        # per BATCH_SIZE stories instead of one per story.
+        for chunk in chunk_list(pt_stories, Config.BATCH_SIZE):
+            # Build inputs per story so one malformed story skips that
+            # story, not the whole chunk
+            chunk_stories = []
+            issue_inputs = []
+            for pt_story in chunk:
+                try:
+                    issue_inputs.append(
+                        self._build_issue_input(pt_story, linear_team_id)
+                    )
+                    chunk_stories.append(pt_story)
+                except Exception as e:
+                    logger.warning(f"Failed to prepare story {pt_story.id}: {str(e)}")
+                    if pbar:
+                        pbar.update(1)
+
             try:
-                linear_issue = await self.migrate_issue(pt_story, linear_team_id)
-                self.issue_map[pt_story.id] = linear_issue
+                created_issues = await self.linear_api.create_issues(issue_inputs)
+            except Exception as e:
+                logger.warning(f"Failed to migrate story batch: {str(e)}")
+                # Continue with the next batch
                 if pbar:
-                    pbar.update(1)
-            except IssueMigrationError as e:
-                logger.warning(f"Failed to migrate story {pt_story.id}: {str(e)}")
-                # Continue with the next story
+                    pbar.update(len(chunk_stories))
+                continue
+
+            task_coros = []
+            for pt_story, issue_input, issue_data in zip(
+                chunk_stories, issue_inputs, created_issues
+            ):
+                linear_issue = self._build_linear_issue(
+                    pt_story, issue_input, issue_data, linear_team_id
+                )
+                self.issue_map[pt_story.id] = linear_issue
+
+                # Migrate tasks as sub-issues
+                if pt_story.tasks:
+                    task_coros.append(
+                        self.migrate_tasks(pt_story.tasks, linear_issue, linear_team_id)
+                    )
+
+            # Task migration is independent per story; overlap the waits
+            await semaphore_gather(Config.MAX_CONCURRENT_REQUESTS, *task_coros)
+
+            if pbar:
+                pbar.update(len(chunk_stories))
 
         logger.info(f"Issue migration completed. Migrated {len(self.issue_map)} issues")
         return self.issue_map
 
     async def fetch_workflow_states(self, linear_team_id):
         """Fetch and cache workflow states for the team."""
+        cached = self._workflow_states_by_team.get(linear_team_id)
+        if cached is not None:
+            self.workflow_states = cached
+            return
+
         states = await self.linear_api.get_workflow_states(linear_team_id)
         self.workflow_states = {state["name"]: state["id"] for state in states}
+        self._workflow_states_by_team[linear_team_id] = self.workflow_states
+
+    def _prefetch_users(self, pt_stories):
+        """Batch-resolve assignee and creator IDs for a story list."""
+        user_ids = {
+            pt_story.requested_by_id
+            for pt_story in pt_stories
+            if pt_story.requested_by_id
+        }
+        for pt_story in pt_stories:
+            user_ids.update(owner.id for owner in pt_story.owners)
+
+        self.user_id_map.update(
+            {
+                user_id: linear_user.id
+                for user_id in user_ids
+                if (linear_user := self.user_migrator.get_linear_user(user_id))
+            }
+        )
+
+    def _build_issue_input(self, pt_story, linear_team_id):
+        """
+        Map a Pivotal Tracker story to a Linear IssueCreateInput dict.
+
+        :param pt_story: Pivotal Tracker story object from the database
+        :param linear_team_id: ID of the Linear team to create the issue in
+        :return: IssueCreateInput dict with None values stripped
+        """
+        # Map Pivotal Tracker attributes to Linear attributes
+        state_id = self.workflow_states.get(map_state(pt_story.current_state))
+        priority = map_priority(pt_story.story_priority)
+
+        # Get assignee
+        assignee_id = None
+        if pt_story.owners:
+            assignee_id = self.user_id_map.get(pt_story.owners[0].id)
+
+        # Get project (epic) if applicable
+        project_id = None
+        for label in pt_story.labels:
+            pt_epic_id = self.label_epic_map.get(label.id)
+            linear_project = self.project_migrator.get_linear_project(pt_epic_id)
+            if linear_project:
+                project_id = linear_project.id
+                break
+
+        # Get cycle if applicable
+        cycle_id = None
+        if pt_story.iteration:
+            linear_cycle = self.cycle_migrator.get_linear_cycle(
+                pt_story.iteration.number
+            )
+            if linear_cycle:
+                cycle_id = linear_cycle["id"]
+
+        issue_input = {
+            "teamId": linear_team_id,
+            "title": sanitize_name(pt_story.name),
+            "description": pt_story.description or "",
+            "stateId": state_id,
+            "priority": priority,
+            "estimate": pt_story.estimate,
+            "assigneeId": assignee_id,
+            "projectId": project_id,
+            "cycleId": cycle_id,
+        }
+        return {key: value for key, value in issue_input.items() if value is not None}
+
+    def _build_linear_issue(self, pt_story, issue_input, issue_data, linear_team_id):
+        """
+        Build the LinearIssue wrapper for a created issue.
+
+        :param pt_story: Pivotal Tracker story object from the database
+        :param issue_input: IssueCreateInput dict the issue was created from
+        :param issue_data: Issue dict returned by the Linear API
+        :param linear_team_id: ID of the Linear team the issue belongs to
+        :return: LinearIssue object
+        """
+        creator_id = self.user_id_map.get(pt_story.requested_by_id)
+
+        return LinearIssue(
+            id=issue_data["id"],
+            title=issue_data["title"],
+            description=issue_data["description"],
+            team_id=linear_team_id,
+            project_id=issue_input.get("projectId"),
+            cycle_id=issue_input.get("cycleId"),
+            assignee_id=issue_input.get("assigneeId"),
+            creator_id=creator_id,
+            state_id=issue_input.get("stateId"),
+            priority=issue_input.get("priority", 0),
+            estimate=issue_input.get("estimate"),
+            labels=[label.name for label in pt_story.labels],
+            created_at=pt_story.created_at,
+            updated_at=pt_story.updated_at,
+        )
 
     async def migrate_issue(self, pt_story, linear_team_id):
         """
@@ -85,81 +234,11 @@ class IssueMigrator:
         logger.info(f"Migrating story to issue: {pt_story.id}")
 
         try:
-            # Map Pivotal Tracker attributes to Linear attributes
-            title = sanitize_name(pt_story.name)
-            description = pt_story.description or ""
-            state_id = self.workflow_states.get(map_state(pt_story.current_state))
-            priority = map_priority(pt_story.story_priority)
-            estimate = pt_story.estimate
-            labels = [label.name for label in pt_story.labels]
-
-            # Get assignee and creator
-            assignee_id = None
-            if pt_story.owner_ids:
-                linear_user = self.user_migrator.get_linear_user(pt_story.owner_ids[0])
-                if linear_user:
-                    assignee_id = linear_user.id
-
-            creator_id = None
-            if pt_story.requested_by_id:
-                linear_user = self.user_migrator.get_linear_user(
-                    pt_story.requested_by_id
-                )
-                if linear_user:
-                    creator_id = linear_user.id
-
-            # Get project (epic) if applicable
-            project_id = None
-            if pt_story.label_ids:
-                for label_id in pt_story.label_ids:
-                    pt_epic_id = self.label_epic_map.get(label_id)
-                    linear_project = self.project_migrator.get_linear_project(
-                        pt_epic_id
-                    )
-                    if linear_project:
-                        project_id = linear_project.id
-                        break
-
-            # Get cycle if applicable
-            cycle_id = None
-            if pt_story.iteration:
-                linear_cycle = self.cycle_migrator.get_linear_cycle(
-                    pt_story.iteration.number
-                )
-                if linear_cycle:
-                    cycle_id = linear_cycle.id
-
-            # Create the issue in Linear
-            linear_issue_data = await self.linear_api.create_issue(
-                team_id=linear_team_id,
-                title=title,
-                description=description,
-                state_id=state_id,
-                priority=priority,
-                estimate=estimate,
-                assignee_id=assignee_id,
-                creator_id=creator_id,
-                project_id=project_id,
-                cycle_id=cycle_id,
-                labels=labels,
-            )
-
-            # Create LinearIssue object
-            linear_issue = LinearIssue(
-                id=linear_issue_data["id"],
-                title=linear_issue_data["title"],
-                description=linear_issue_data["description"],
-                team_id=linear_team_id,
-                project_id=project_id,
-                cycle_id=cycle_id,
-                assignee_id=assignee_id,
-                creator_id=creator_id,
-                state_id=state_id,
-                priority=priority,
-                estimate=estimate,
-                labels=labels,
-                created_at=pt_story.created_at,
-                updated_at=pt_story.updated_at,
+            self._prefetch_users([pt_story])
+            issue_input = self._build_issue_input(pt_story, linear_team_id)
+            issue_data = (await self.linear_api.create_issues([issue_input]))[0]
+            linear_issue = self._build_linear_issue(
+                pt_story, issue_input, issue_data, linear_team_id
             )
 
             # Migrate tasks as sub-issues
@@ -181,37 +260,55 @@ class IssueMigrator:
         :param parent_issue: Parent LinearIssue object
         :param linear_team_id: ID of the Linear team
         """
-        for pt_task in pt_tasks:
-            try:
-                sub_issue_data = await self.linear_api.create_issue(
-                    team_id=linear_team_id,
-                    title=sanitize_name(pt_task.description),
-                    description="",
-                    state_id=self.workflow_states.get("Todo"),
-                    parent_id=parent_issue.id,
-                )
-
-                sub_issue = LinearIssue(
-                    id=sub_issue_data["id"],
-                    title=sub_issue_data["title"],
-                    description=sub_issue_data["description"],
-                    team_id=linear_team_id,
-                    parent_id=parent_issue.id,
-                    state_id=self.workflow_states.get("Todo"),
-                    created_at=pt_task.created_at,
-                    updated_at=pt_task.updated_at,
-                )
-
-                parent_issue.sub_issues.append(sub_issue)
-
-                # If the task is complete, update its state
-                if pt_task.complete:
-                    await self.linear_api.update_issue(
-                        sub_issue.id, {"stateId": self.workflow_states.get("Done")}
-                    )
+        results = await semaphore_gather(
+            Config.MAX_CONCURRENT_REQUESTS,
+            *(
+                self.migrate_task(pt_task, parent_issue, linear_team_id)
+                for pt_task in pt_tasks
+            ),
+        )
+
+        for pt_task, result in zip(pt_tasks, results):
+            if isinstance(result, Exception):
+                logger.warning(f"Failed to migrate task {pt_task.id}: {str(result)}")
+            else:
+                parent_issue.sub_issues.append(result)
+
+    async def migrate_task(self, pt_task, parent_issue, linear_team_id):
+        """
+        Migrate a single Pivotal Tracker task as a sub-issue in Linear.
 
-            except Exception as e:
-                logger.warning(f"Failed to migrate task {pt_task.id}: {str(e)}")
+        :param pt_task: Pivotal Tracker task object
+        :param parent_issue: Parent LinearIssue object
+        :param linear_team_id: ID of the Linear team
+        :return: LinearIssue object for the sub-issue
+        """
+        # Completed tasks are created directly in Done, saving the
+        # follow-up update_issue round trip.
+        state_id = self.workflow_states.get("Done" if pt_task.complete else "Todo")
+
+        # kwargs become GraphQL variables, so they must use the camelCase
+        # names the CreateIssue mutation declares
+        sub_issue_data = await self.linear_api.create_issue(
+            team_id=linear_team_id,
+            title=sanitize_name(pt_task.description),
+            description="",
+            stateId=state_id,
+            parentId=parent_issue.id,
+        )
+
+        return LinearIssue(
+            id=sub_issue_data["id"],
+            title=sub_issue_data["title"],
+            description=sub_issue_data["description"],
+            team_id=linear_team_id,
+            # PT tasks carry no author, so there is no creator to map
+            creator_id=None,
+            parent_id=parent_issue.id,
+            state_id=state_id,
+            created_at=pt_task.created_at,
+            updated_at=pt_task.updated_at,
+        )
 
     def get_linear_issue(self, pt_story_id):
         """
@@ -230,17 +327,16 @@ class IssueMigrator:
         :param linear_team_id: ID of the Linear team to create the issue in
         :return: LinearIssue object
         """
-        if pt_story.id not in self.issue_map:
-            linear_issue = await self.migrate_issue(pt_story, linear_team_id)
-            self.issue_map[pt_story.id] = linear_issue
-        return self.issue_map[pt_story.id]
-
-    async def get_label_epic_map(project_id: int):
-        """Retrieve a mapping of label IDs to epic IDs for a given project."""
-        with get_db() as db:
-            label_epic_map = {
-                epic.label_id: epic.id
-                for epic in db.query(Epic).filter_by(project_id=project_id).all()
-            }
-            db.expunge_all()
-            return label_epic_map
+        linear_issue = self.issue_map.get(pt_story.id)
+        if linear_issue is not None:
+            return linear_issue
+
+        # Double-check under a per-story lock so concurrent callers racing
+        # on the same story don't create duplicate Linear issues
+        lock = self._locks.setdefault(pt_story.id, asyncio.Lock())
+        async with lock:
+            linear_issue = self.issue_map.get(pt_story.id)
+            if linear_issue is None:
+                linear_issue = await self.migrate_issue(pt_story, linear_team_id)
+                self.issue_map[pt_story.id] = linear_issue
+            return linear_issue
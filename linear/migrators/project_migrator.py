@@ -1,16 +1,19 @@
 # linear/migrators/project_migrator.py
 
+import asyncio
+
 from ..api import LinearAPI
-from ..exceptions import ProjectCreationError
+from ..config import Config
 from ..logger import logger
 from ..models import LinearProject
-from ..utils import sanitize_name, with_progress
+from ..utils import sanitize_name, semaphore_gather, with_progress
 
 
 class ProjectMigrator:
     def __init__(self, linear_api: LinearAPI):
         self.linear_api = linear_api
         self.project_map = {}  # Map PT epic IDs to Linear project objects
+        self._locks = {}  # Per-epic locks so concurrent ensures migrate once
 
     @with_progress(desc="Migrating Epics to Projects")
     async def migrate_projects(self, pt_epics, linear_team_id, pbar=None):
@@ -27,15 +30,20 @@ class ProjectMigrator:
             pbar.total = len(pt_epics)
             pbar.refresh()
 
-        for pt_epic in pt_epics:
-            try:
-                linear_project = await self.migrate_project(pt_epic, linear_team_id)
-                self.project_map[pt_epic.id] = linear_project
-                if pbar:
-                    pbar.update(1)
-            except ProjectCreationError as e:
-                logger.warning(f"Failed to migrate epic {pt_epic.name}: {str(e)}")
+        # Epics are independent; create the projects concurrently
+        results = await semaphore_gather(
+            Config.MAX_CONCURRENT_REQUESTS,
+            *(self.migrate_project(pt_epic, linear_team_id) for pt_epic in pt_epics),
+        )
+
+        for pt_epic, result in zip(pt_epics, results):
+            if isinstance(result, Exception):
+                logger.warning(f"Failed to migrate epic {pt_epic.name}: {str(result)}")
                 # Continue with the next epic
+            else:
+                self.project_map[pt_epic.id] = result
+            if pbar:
+                pbar.update(1)
 
         logger.info(
             f"Project migration completed. Migrated {len(self.project_map)} projects"
@@ -52,31 +60,24 @@ class ProjectMigrator:
         """
         logger.info(f"Migrating epic to project: {pt_epic.name}")
 
-        try:
-            # Sanitize the epic name
-            sanitized_name = sanitize_name(pt_epic.name)
-
-            # Create the project in Linear
-            linear_project_data = await self.linear_api.create_project(
-                team_id=linear_team_id,
-                name=sanitized_name,
-                description=pt_epic.description,
-            )
-
-            # Create LinearProject object
-            linear_project = LinearProject(
-                id=linear_project_data["id"],
-                name=linear_project_data["name"],
-                description=linear_project_data.get("description"),
-                team_id=linear_team_id,
-            )
+        # Sanitize the epic name
+        sanitized_name = sanitize_name(pt_epic.name)
 
-            return linear_project
+        # Create the project in Linear. Failures propagate as-is; the
+        # callers log them with the epic context, so re-wrapping here
+        # only added an exception round trip.
+        linear_project_data = await self.linear_api.create_project(
+            team_id=linear_team_id,
+            name=sanitized_name,
+            description=pt_epic.description,
+        )
 
-        except Exception as e:
-            raise ProjectCreationError(
-                f"Failed to migrate epic {pt_epic.name}: {str(e)}"
-            )
+        return LinearProject(
+            id=linear_project_data["id"],
+            name=linear_project_data["name"],
+            description=linear_project_data.get("description"),
+            team_id=linear_team_id,
+        )
 
     def get_linear_project(self, pt_epic_id):
         """
@@ -95,7 +96,16 @@ class ProjectMigrator:
         :param linear_team_id: ID of the Linear team to create the project in
         :return: LinearProject object
         """
-        if pt_epic.id not in self.project_map:
-            linear_project = await self.migrate_project(pt_epic, linear_team_id)
-            self.project_map[pt_epic.id] = linear_project
-        return self.project_map[pt_epic.id]
+        linear_project = self.project_map.get(pt_epic.id)
+        if linear_project is not None:
+            return linear_project
+
+        # Double-check under a per-epic lock so concurrent callers racing
+        # on the same epic don't create duplicate Linear projects
+        lock = self._locks.setdefault(pt_epic.id, asyncio.Lock())
+        async with lock:
+            linear_project = self.project_map.get(pt_epic.id)
+            if linear_project is None:
+                linear_project = await self.migrate_project(pt_epic, linear_team_id)
+                self.project_map[pt_epic.id] = linear_project
+            return linear_project
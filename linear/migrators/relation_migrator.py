@@ -1,10 +1,11 @@
 # linear/migrators/relation_migrator.py
 
 from ..api import LinearAPI
+from ..config import Config
 from ..exceptions import RelationMigrationError
 from ..logger import logger
 from ..models import LinearIssueRelation
-from ..utils import with_progress
+from ..utils import semaphore_gather, with_progress
 
 
 class RelationMigrator:
@@ -13,43 +14,55 @@ class RelationMigrator:
         self.issue_migrator = issue_migrator
 
     @with_progress(desc="Migrating Issue Relations")
-    async def migrate_relations(self, pt_stories, pbar=None):
+    async def migrate_relations(self, story_issue_pairs, pbar=None):
         """
         Migrate relations (blockers) from Pivotal Tracker stories to Linear issue relations.
 
-        :param pt_stories: List of Pivotal Tracker story objects from the database
+        :param story_issue_pairs: List of (PT story, LinearIssue) pairs built
+            by the orchestrator from already-migrated issues
         :param pbar: Progress bar object
         :return: List of created Linear issue relation IDs
         """
-        logger.info(f"Starting migration for relations of {len(pt_stories)} stories")
+        logger.info(
+            f"Starting migration for relations of {len(story_issue_pairs)} stories"
+        )
         if pbar:
-            pbar.total = len(pt_stories)
+            pbar.total = len(story_issue_pairs)
             pbar.refresh()
 
         migrated_relations = []
 
-        for pt_story in pt_stories:
-            try:
-                relations = await self.migrate_story_relations(pt_story)
-                migrated_relations.extend(relations)
-                if pbar:
-                    pbar.update(1)
-            except RelationMigrationError as e:
+        # Stories are independent; migrate their relations concurrently
+        results = await semaphore_gather(
+            Config.MAX_CONCURRENT_REQUESTS,
+            *(
+                self.migrate_story_relations(pt_story, linear_issue)
+                for pt_story, linear_issue in story_issue_pairs
+            ),
+        )
+
+        for (pt_story, _), result in zip(story_issue_pairs, results):
+            if isinstance(result, Exception):
                 logger.warning(
-                    f"Failed to migrate relations for story {pt_story.id}: {str(e)}"
+                    f"Failed to migrate relations for story {pt_story.id}: {str(result)}"
                 )
                 # Continue with the next story
+            else:
+                migrated_relations.extend(result)
+            if pbar:
+                pbar.update(1)
 
         logger.info(
             f"Relation migration completed. Migrated {len(migrated_relations)} relations"
         )
         return migrated_relations
 
-    async def migrate_story_relations(self, pt_story):
+    async def migrate_story_relations(self, pt_story, linear_issue):
         """
         Migrate relations for a single Pivotal Tracker story.
 
         :param pt_story: Pivotal Tracker story object from the database
+        :param linear_issue: LinearIssue object the story was migrated to
         :return: List of created LinearIssueRelation objects
         """
         logger.info(f"Migrating relations for story: {pt_story.id}")
@@ -57,38 +70,51 @@ class RelationMigrator:
         migrated_relations = []
 
         try:
-            linear_issue = self.issue_migrator.get_linear_issue(pt_story.id)
-            if not linear_issue:
-                logger.warning(
-                    f"No corresponding Linear issue found for PT story {pt_story.id}"
-                )
-                return migrated_relations
+            # Resolve the blocker issues first, then create all "blocks"
+            # relations for the story in one concurrent gather instead of
+            # one round trip per blocker.
+            # Bind the lookup once; it is hit for every blocker in the loop
+            get_linear_issue = self.issue_migrator.get_linear_issue
 
-            # Handle blockers
+            blocker_issue_ids = []
             for blocker in pt_story.blockers:
                 if blocker.resolved:
                     continue  # Skip resolved blockers
 
                 blocker_story = blocker.story
-                linear_blocker_issue = self.issue_migrator.get_linear_issue(
-                    blocker_story.id
-                )
+                linear_blocker_issue = get_linear_issue(blocker_story.id)
                 if not linear_blocker_issue:
                     logger.warning(
                         f"No corresponding Linear issue found for PT blocker story {blocker_story.id}"
                     )
                     continue
 
-                # Create "blocks" relation in Linear
-                relation_data = await self.linear_api.create_issue_relation(
-                    issue_id=linear_blocker_issue.id,
-                    related_issue_id=linear_issue.id,
-                    type="blocks",
-                )
+                blocker_issue_ids.append(linear_blocker_issue.id)
+
+            relation_datas = await semaphore_gather(
+                Config.MAX_CONCURRENT_REQUESTS,
+                *(
+                    self.linear_api.create_issue_relation(
+                        issue_id=blocker_issue_id,
+                        related_issue_id=linear_issue.id,
+                        type="blocks",
+                    )
+                    for blocker_issue_id in blocker_issue_ids
+                ),
+            )
+
+            for blocker_issue_id, relation_data in zip(
+                blocker_issue_ids, relation_datas
+            ):
+                if isinstance(relation_data, Exception):
+                    logger.warning(
+                        f"Failed to create relation for blocker issue {blocker_issue_id}: {str(relation_data)}"
+                    )
+                    continue
 
                 linear_relation = LinearIssueRelation(
                     id=relation_data["id"],
-                    issue_id=linear_blocker_issue.id,
+                    issue_id=blocker_issue_id,
                     related_issue_id=linear_issue.id,
                     type="blocks",
                 )
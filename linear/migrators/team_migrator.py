@@ -1,14 +1,16 @@
 # linear/migrators/team_migrator.py
 
+import asyncio
+
 from database import get_db
 from models import Epic, Label
 
 from ..api import LinearAPI
-from ..exceptions import TeamCreationError
+from ..config import Config
 from ..linear_setup import LinearSetup
 from ..logger import logger
 from ..models import LinearTeam
-from ..utils import sanitize_name, with_progress
+from ..utils import sanitize_name, semaphore_gather, with_progress
 
 
 class TeamMigrator:
@@ -16,6 +18,7 @@ class TeamMigrator:
         self.linear_api = linear_api
         self.linear_setup = linear_setup
         self.team_map = {}  # Map PT project IDs to Linear team objects
+        self._locks = {}  # Per-project locks so concurrent ensures migrate once
 
     @with_progress(desc="Migrating Teams")
     async def migrate_teams(self, pt_projects, pbar=None):
@@ -31,15 +34,22 @@ class TeamMigrator:
             pbar.total = len(pt_projects)
             pbar.refresh()
 
-        for pt_project in pt_projects:
-            try:
-                linear_team = await self.migrate_team(pt_project)
-                self.team_map[pt_project.id] = linear_team
-                if pbar:
-                    pbar.update(1)
-            except TeamCreationError as e:
-                logger.warning(f"Failed to migrate project {pt_project.name}: {str(e)}")
+        # Projects are independent; create the teams concurrently
+        results = await semaphore_gather(
+            Config.MAX_CONCURRENT_REQUESTS,
+            *(self.migrate_team(pt_project) for pt_project in pt_projects),
+        )
+
+        for pt_project, result in zip(pt_projects, results):
+            if isinstance(result, Exception):
+                logger.warning(
+                    f"Failed to migrate project {pt_project.name}: {str(result)}"
+                )
                 # Continue with the next project
+            else:
+                self.team_map[pt_project.id] = result
+            if pbar:
+                pbar.update(1)
 
         logger.info(f"Team migration completed. Migrated {len(self.team_map)} teams")
         return self.team_map
@@ -53,33 +63,31 @@ class TeamMigrator:
         """
         logger.info(f"Migrating project to team: {pt_project.name}")
 
-        try:
-            # Sanitize the project name
-            sanitized_name = sanitize_name(pt_project.name)
+        # Sanitize the project name
+        sanitized_name = sanitize_name(pt_project.name)
 
-            # Use LinearSetup to create the team and set up workflow states
-            linear_team_data = await self.linear_setup.setup_team(
-                sanitized_name, pt_project.description
-            )
+        # The label fetch only needs the PT project ID, so it can run
+        # while LinearSetup creates the team and workflow states.
+        # Failures propagate as-is; the callers log them with the
+        # project context, so re-wrapping here only added an exception
+        # round trip.
+        linear_team_data, pt_labels = await asyncio.gather(
+            self.linear_setup.setup_team(sanitized_name, pt_project.description),
+            self.get_pt_project_labels(pt_project.id),
+        )
 
-            # Create LinearTeam object
-            linear_team = LinearTeam(
-                id=linear_team_data["id"],
-                name=linear_team_data["name"],
-                key=linear_team_data["key"],
-                description=linear_team_data.get("description"),
-            )
+        # Create LinearTeam object
+        linear_team = LinearTeam(
+            id=linear_team_data["id"],
+            name=linear_team_data["name"],
+            key=linear_team_data["key"],
+            description=linear_team_data.get("description"),
+        )
 
-            # Set up labels for the team
-            pt_labels = await self.get_pt_project_labels(pt_project.id)
-            await self.linear_setup.setup_labels(linear_team.id, pt_labels)
+        # Set up labels for the team
+        await self.linear_setup.setup_labels(linear_team.id, pt_labels)
 
-            return linear_team
-
-        except Exception as e:
-            raise TeamCreationError(
-                f"Failed to migrate project {pt_project.name}: {str(e)}"
-            )
+        return linear_team
 
     def get_linear_team(self, pt_project_id):
         """
@@ -97,30 +105,44 @@ class TeamMigrator:
         :param pt_project: Pivotal Tracker project object
         :return: LinearTeam object
         """
-        if pt_project.id not in self.team_map:
-            linear_team = await self.migrate_team(pt_project)
-            self.team_map[pt_project.id] = linear_team
-        return self.team_map[pt_project.id]
+        linear_team = self.team_map.get(pt_project.id)
+        if linear_team is not None:
+            return linear_team
+
+        # Double-check under a per-project lock so concurrent callers
+        # racing on the same project don't create duplicate Linear teams
+        lock = self._locks.setdefault(pt_project.id, asyncio.Lock())
+        async with lock:
+            linear_team = self.team_map.get(pt_project.id)
+            if linear_team is None:
+                linear_team = await self.migrate_team(pt_project)
+                self.team_map[pt_project.id] = linear_team
+            return linear_team
+
+    @staticmethod
+    def _query_labels_sync(pt_project_id):
+        """Blocking label query; run off the event loop via to_thread."""
+        with get_db() as db:
+            # One outer join answers "is this label an epic label" for every
+            # label at once, instead of a separate Epic query per label.
+            rows = (
+                db.query(Label.name, Epic.id)
+                .outerjoin(Epic, Epic.label_id == Label.id)
+                .filter(Label.project_id == pt_project_id)
+                .all()
+            )
+
+            # Plain tuples come back, so nothing needs expunging
+            return [(name, epic_id is not None) for name, epic_id in rows]
 
     async def get_pt_project_labels(self, pt_project_id):
         """
         Get the labels for a Pivotal Tracker project.
 
+        The synchronous DB query runs in a worker thread so in-flight API
+        requests keep progressing while the database answers.
+
         :param pt_project: Pivotal Tracker project object
         :return: Tuple of label names and boolean of epic or not
         """
-        with get_db() as db:
-            labels = db.query(Label).filter(Label.project_id == pt_project_id).all()
-
-            results = []
-
-            # if any labels are associated with an epic, return it with True
-            for label in labels:
-                epic = db.query(Epic).filter(Epic.label_id == label.id).first()
-                if epic:
-                    results.append((label.name, True))
-                else:
-                    results.append((label.name, False))
-
-            db.expunge_all()
-            return results
+        return await asyncio.to_thread(self._query_labels_sync, pt_project_id)
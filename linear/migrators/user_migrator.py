@@ -1,11 +1,12 @@
 # linear/migrators/user_migrator.py
 
+import asyncio
+
 from ..api import LinearAPI
 from ..config import Config
-from ..exceptions import UserMigrationError
 from ..logger import logger
 from ..models import LinearUser
-from ..utils import with_progress
+from ..utils import semaphore_gather, with_progress
 
 
 class UserMigrator:
@@ -13,6 +14,7 @@ class UserMigrator:
         self.linear_api = linear_api
         self.linear_team_id = None
         self.user_map = Config.LINEAR_USER_MAP  # Map PT user IDs to Linear user objects
+        self._locks = {}  # Per-user locks so concurrent ensures migrate once
 
     @with_progress(desc="Migrating Users")
     async def migrate_users(self, pt_users, linear_team_id, pbar=None):
@@ -30,14 +32,67 @@ class UserMigrator:
 
         self.linear_team_id = linear_team_id
 
-        for pt_user in pt_users:
-            try:
-                await self.migrate_user(pt_user)
-                if pbar:
-                    pbar.update(1)
-            except UserMigrationError as e:
-                logger.warning(f"Failed to migrate user {pt_user.name}: {str(e)}")
-                # Continue with the next user
+        # Phase 1: resolve existing Linear accounts for all unknown users
+        # in one concurrent sweep instead of one lookup per migrate_user.
+        unknown_users = [
+            pt_user for pt_user in pt_users if pt_user.id not in self.user_map
+        ]
+        lookups = await semaphore_gather(
+            Config.MAX_CONCURRENT_REQUESTS,
+            *(self.linear_api.get_user(pt_user.email) for pt_user in unknown_users),
+        )
+
+        to_invite = []
+        for pt_user, linear_user_data in zip(unknown_users, lookups):
+            if isinstance(linear_user_data, Exception):
+                logger.warning(
+                    f"Failed to look up user {pt_user.name}: {str(linear_user_data)}"
+                )
+            elif linear_user_data:
+                self.user_map[pt_user.id] = LinearUser(
+                    id=linear_user_data["id"],
+                    name=linear_user_data["name"],
+                    email=linear_user_data["email"],
+                )
+            else:
+                to_invite.append(pt_user)
+
+        # Phase 2: invite users without a Linear account, acknowledging
+        # that we won't get their account IDs until they accept.
+        invites = await semaphore_gather(
+            Config.MAX_CONCURRENT_REQUESTS,
+            *(
+                self.linear_api.invite_user(pt_user.email, linear_team_id)
+                for pt_user in to_invite
+            ),
+        )
+        for pt_user, result in zip(to_invite, invites):
+            if isinstance(result, Exception):
+                logger.warning(f"Failed to invite user {pt_user.name}: {str(result)}")
+
+        # Phase 3: add every resolved user to the team. ensure_user caches
+        # None for invited-but-unaccepted accounts, so presence in the map
+        # alone doesn't mean there is an ID to add.
+        known_users = [
+            pt_user for pt_user in pt_users if self.user_map.get(pt_user.id) is not None
+        ]
+        additions = await semaphore_gather(
+            Config.MAX_CONCURRENT_REQUESTS,
+            *(
+                self.linear_api.add_user_to_team(
+                    self.user_map[pt_user.id].id, linear_team_id
+                )
+                for pt_user in known_users
+            ),
+        )
+        for pt_user, result in zip(known_users, additions):
+            if isinstance(result, Exception):
+                logger.warning(
+                    f"Failed to add user {pt_user.name} to team: {str(result)}"
+                )
+
+        if pbar:
+            pbar.update(len(pt_users))
 
         logger.info(f"User migration completed. Migrated {len(self.user_map)} users")
         return self.user_map
@@ -51,32 +106,33 @@ class UserMigrator:
         """
         logger.info(f"Migrating user: {pt_user.name}")
 
-        try:
-            # Get the linear user
-            linear_user = self.get_linear_user(pt_user.id)
+        # Failures propagate as-is; the callers log them with the user
+        # context, so re-wrapping here only added an exception round trip.
 
-            if not linear_user:
-                linear_user = await self.linear_api.get_user(pt_user.email)
+        # Get the linear user
+        linear_user = self.get_linear_user(pt_user.id)
 
-                if linear_user:
-                    linear_user = LinearUser(**linear_user)
-                    self.user_map[pt_user.id] = linear_user
-                else:
-                    # invite the user in Linear, acknowledging that we won't get the account id until they accept
-                    await self.linear_api.invite_user(
-                        pt_user.email, self.linear_team_id
-                    )
+        if not linear_user:
+            linear_user = await self.linear_api.get_user(pt_user.email)
 
             if linear_user:
-                # Attempt to add the user to the team
-                await self.linear_api.add_user_to_team(
-                    linear_user.id, self.linear_team_id
+                # Explicit fields instead of **unpacking: skips building a
+                # kwargs dict and ignores any extra keys the API adds
+                linear_user = LinearUser(
+                    id=linear_user["id"],
+                    name=linear_user["name"],
+                    email=linear_user["email"],
                 )
+                self.user_map[pt_user.id] = linear_user
+            else:
+                # invite the user in Linear, acknowledging that we won't get the account id until they accept
+                await self.linear_api.invite_user(pt_user.email, self.linear_team_id)
 
-            logger.info(f"User migrated: {pt_user.name}")
+        if linear_user:
+            # Attempt to add the user to the team
+            await self.linear_api.add_user_to_team(linear_user.id, self.linear_team_id)
 
-        except Exception as e:
-            raise UserMigrationError(f"Failed to migrate user {pt_user.name}: {str(e)}")
+        logger.info(f"User migrated: {pt_user.name}")
 
     def get_linear_user(self, pt_user_id):
         """
@@ -94,7 +150,16 @@ class UserMigrator:
         :param pt_user: Pivotal Tracker user object
         :return: LinearUser object
         """
-        if pt_user.id not in self.user_map:
-            linear_user = await self.migrate_user(pt_user)
-            self.user_map[pt_user.id] = linear_user
-        return self.user_map[pt_user.id]
+        if pt_user.id in self.user_map:
+            return self.user_map[pt_user.id]
+
+        # Double-check under a per-user lock so concurrent callers racing
+        # on the same person don't fire duplicate lookups/invites
+        lock = self._locks.setdefault(pt_user.id, asyncio.Lock())
+        async with lock:
+            if pt_user.id not in self.user_map:
+                # migrate_user records the account in user_map when one
+                # exists; invited-but-unaccepted users map to None
+                await self.migrate_user(pt_user)
+                self.user_map.setdefault(pt_user.id, None)
+            return self.user_map[pt_user.id]
@@ -5,14 +5,14 @@ from datetime import datetime
 from typing import List, Optional
 
 
-@dataclass
+@dataclass(slots=True)
 class LinearUser:
     id: str
     name: str
     email: str
 
 
-@dataclass
+@dataclass(slots=True)
 class LinearTeam:
     id: str
     name: str
@@ -20,7 +20,7 @@ class LinearTeam:
     description: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class LinearProject:
     id: str
     name: str
@@ -28,7 +28,7 @@ class LinearProject:
     description: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class LinearCycle:
     id: str
     number: int
@@ -38,21 +38,21 @@ class LinearCycle:
     team_id: str
 
 
-@dataclass
+@dataclass(slots=True)
 class LinearWorkflowState:
     id: str
     name: str
     type: str  # 'backlog', 'unstarted', 'started', 'completed', 'canceled'
 
 
-@dataclass
+@dataclass(slots=True)
 class LinearLabel:
     id: str
     name: str
     team_id: str
 
 
-@dataclass
+@dataclass(slots=True)
 class LinearComment:
     id: str
     body: str
@@ -61,7 +61,7 @@ class LinearComment:
     issue_id: str
 
 
-@dataclass
+@dataclass(slots=True)
 class LinearAttachment:
     id: str
     title: str
@@ -69,7 +69,7 @@ class LinearAttachment:
     issue_id: str
 
 
-@dataclass
+@dataclass(slots=True)
 class LinearIssue:
     id: str
     title: str
@@ -91,7 +91,7 @@ class LinearIssue:
     attachments: List[LinearAttachment] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True)
 class LinearIssueRelation:
     id: str
     issue_id: str
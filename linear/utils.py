@@ -1,52 +1,140 @@
 # linear/utils.py
 
 import asyncio
+import itertools
 import os
-from functools import wraps
+import random
+import re
+import sys
+from functools import lru_cache, wraps
 
 from tqdm import tqdm
 
+from .logger import logger
+
 PROCESSED_TEAMS_FILE = "linear/processed_teams.txt"
 
+# Parsed contents of PROCESSED_TEAMS_FILE; None means not loaded yet
+_processed_teams_cache = None
+
+# Append handle kept open across mark_team_as_processed calls so each
+# mark costs one write instead of an open/close syscall pair
+_processed_teams_file = None
+
 
 def mark_team_as_processed(team_id):
     """Mark a team as processed by writing its ID to a file."""
-    with open(PROCESSED_TEAMS_FILE, "a") as f:
-        f.write(f"{team_id}\n")
+    global _processed_teams_file
+    if _processed_teams_file is None:
+        _processed_teams_file = open(PROCESSED_TEAMS_FILE, "a")
+    _processed_teams_file.write(f"{team_id}\n")
+    # Flush so a crash loses at most the current line; no fsync since
+    # re-processing a team is idempotent anyway
+    _processed_teams_file.flush()
+    if _processed_teams_cache is not None:
+        _processed_teams_cache.add(int(team_id))
+
+
+def close_processed_teams_file():
+    """Close the persistent append handle, if one was opened."""
+    global _processed_teams_file
+    if _processed_teams_file is not None:
+        _processed_teams_file.close()
+        _processed_teams_file = None
 
 
 def get_processed_teams():
     """Get a set of team IDs that have already been processed."""
-    if not os.path.exists(PROCESSED_TEAMS_FILE):
-        return set()
-    with open(PROCESSED_TEAMS_FILE, "r") as f:
-        return set(line.strip() for line in f if line.strip())
+    global _processed_teams_cache
+    if _processed_teams_cache is None:
+        if os.path.exists(PROCESSED_TEAMS_FILE):
+            with open(PROCESSED_TEAMS_FILE, "r") as f:
+                _processed_teams_cache = set(
+                    int(line.strip()) for line in f if line.strip()
+                )
+        else:
+            _processed_teams_cache = set()
+    return _processed_teams_cache
 
 
 def clear_processed_teams():
     """Clear the list of processed teams."""
+    global _processed_teams_cache
+    close_processed_teams_file()
     if os.path.exists(PROCESSED_TEAMS_FILE):
         os.remove(PROCESSED_TEAMS_FILE)
+    _processed_teams_cache = set()
 
 
-def retry_async(max_retries=3, delay=1):
+async def semaphore_gather(n, *coros):
     """
-    A decorator for retrying async functions with exponential backoff.
+    Run coroutines concurrently with at most n in flight at once.
+    Returns results in order; exceptions are returned in place of results.
+
+    Scheduling goes through asyncio.TaskGroup, so cancellation propagates
+    to every in-flight task instead of leaking fire-and-forget work. Each
+    coroutine catches its own Exception and returns it in place, keeping
+    isolated failures from aborting the rest of the batch.
+    """
+    sem = asyncio.Semaphore(n)
+
+    async def _bounded(coro):
+        async with sem:
+            try:
+                return await coro
+            except Exception as e:
+                return e
+
+    async with asyncio.TaskGroup() as tg:
+        tasks = [tg.create_task(_bounded(coro)) for coro in coros]
+    return [task.result() for task in tasks]
+
+
+# HTTP status codes worth retrying: rate limits and transient server errors
+RETRYABLE_STATUSES = frozenset({429, 500, 502, 503, 504})
+
+
+def retry_async(
+    max_retries=3, delay=1, retry_on=(asyncio.TimeoutError, ConnectionError)
+):
+    """
+    A decorator for retrying async functions with jittered exponential backoff.
+
+    Only exceptions in retry_on are retried; anything else (programmer
+    errors, 4xx client errors) is raised immediately rather than burning
+    backoff time on a call that will never succeed. Exceptions carrying an
+    HTTP status are retried only for 429/5xx, and a Retry-After header is
+    honored when the server sends one. Sleeps are drawn uniformly from
+    [0, delay * 2^attempt] so concurrent retries spread out instead of
+    hammering the API in lockstep.
     """
 
     def decorator(func):
         @wraps(func)
         async def wrapper(*args, **kwargs):
             retries = 0
-            while retries < max_retries:
+            while True:
                 try:
                     return await func(*args, **kwargs)
-                except Exception as e:
+                except retry_on as e:
+                    status = getattr(e, "status", None) or getattr(e, "code", None)
+                    if status is not None and status not in RETRYABLE_STATUSES:
+                        raise
                     retries += 1
                     if retries == max_retries:
                         raise
-                    await asyncio.sleep(delay * (2 ** (retries - 1)))
-            return await func(*args, **kwargs)
+                    retry_after = None
+                    headers = getattr(e, "headers", None)
+                    if headers is not None:
+                        try:
+                            retry_after = float(headers.get("Retry-After"))
+                        except (TypeError, ValueError):
+                            retry_after = None
+                    if retry_after is not None:
+                        sleep = retry_after
+                    else:
+                        sleep = random.uniform(0, delay * (2 ** (retries - 1)))
+                    await asyncio.sleep(sleep)
 
         return wrapper
 
@@ -54,65 +142,160 @@ def retry_async(max_retries=3, delay=1):
 
 
 def chunk_list(lst, chunk_size):
-    """Split a list into smaller chunks of a specified size."""
-    return [lst[i : i + chunk_size] for i in range(0, len(lst), chunk_size)]
+    """
+    Yield successive chunks of a specified size from an iterable.
 
+    Chunks are produced lazily so large inputs are never duplicated into
+    a second list of slices.
+    """
+    it = iter(lst)
+    while chunk := list(itertools.islice(it, chunk_size)):
+        yield chunk
+
+
+# Anything outside alphanumerics (incl. underscore via \w), spaces and
+# hyphens gets stripped; the compiled pattern scans at C speed instead of
+# a per-character Python loop.
+_INVALID_NAME_CHARS = re.compile(r"[^\w \-]")
 
+
+@lru_cache(maxsize=1024)
 def sanitize_name(name, max_length=50):
     """
     Sanitize a name for use in Linear.
     Remove invalid characters and truncate if necessary.
+    Results are memoized since names repeat across stories and runs.
     """
     # Remove or replace invalid characters
-    sanitized = "".join(c for c in name if c.isalnum() or c in [" ", "-", "_"])
+    sanitized = _INVALID_NAME_CHARS.sub("", name)
     # Truncate if longer than max_length
     return sanitized[:max_length].strip()
 
 
+# Mapping tables hoisted to module scope so the per-issue map_* calls do
+# a single dict hit instead of rebuilding the literal on every call
+
+_PRIORITY_MAP = {
+    "p0": 1,  # Urgent
+    "p1": 2,  # High
+    "p2": 3,  # Medium
+    "p3": 4,  # Low
+    "p4": 0,  # No priority
+}
+
+_STATE_MAP = {
+    "unstarted": "Todo",
+    "started": "In Progress",
+    "finished": "In Review",
+    "delivered": "Done",
+    "accepted": "Done",
+    "rejected": "Todo",
+}
+
+_TYPE_MAP = {"feature": "Feature", "bug": "Bug", "chore": "Task"}
+
+
 def map_priority(pt_priority):
     """Map Pivotal Tracker priority to Linear priority."""
-    priority_map = {
-        "p0": 1,  # Urgent
-        "p1": 2,  # High
-        "p2": 3,  # Medium
-        "p3": 4,  # Low
-        "p4": 0,  # No priority
-    }
-    return priority_map.get(pt_priority.lower(), 0)
+    key = pt_priority if pt_priority.islower() else pt_priority.lower()
+    return _PRIORITY_MAP.get(key, 0)
 
 
 def map_state(pt_state):
     """Map Pivotal Tracker state to Linear state."""
-    state_map = {
-        "unstarted": "Todo",
-        "started": "In Progress",
-        "finished": "In Review",
-        "delivered": "Done",
-        "accepted": "Done",
-        "rejected": "Todo",
-    }
-    return state_map.get(pt_state.lower(), "Todo")
+    key = pt_state if pt_state.islower() else pt_state.lower()
+    return _STATE_MAP.get(key, "Todo")
 
 
 def map_issue_type(pt_type):
     """Map Pivotal Tracker issue type to Linear issue type."""
-    type_map = {"feature": "Feature", "bug": "Bug", "chore": "Task"}
-    return type_map.get(pt_type.lower(), "Feature")
+    key = pt_type if pt_type.islower() else pt_type.lower()
+    return _TYPE_MAP.get(key, "Feature")
+
+
+class _NullPbar:
+    """No-op stand-in for tqdm when progress output would be pure overhead."""
+
+    total = None
+
+    def update(self, *args, **kwargs):
+        pass
+
+    def refresh(self):
+        pass
+
+    def close(self):
+        pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        return False
+
+
+class _LogPbar:
+    """
+    Progress counter that logs milestones instead of rendering a bar.
+
+    Used where tqdm's ANSI redraws are pointless (CI logs, pipes): counts
+    updates and emits one log line roughly every 5% of the total.
+    """
+
+    def __init__(self, desc=None, total=None):
+        self.desc = desc or "Progress"
+        self.total = total
+        self.n = 0
+        self._last_logged = 0
+
+    def update(self, n=1):
+        self.n += n
+        step = max(1, self.total // 20) if self.total else 100
+        if self.n - self._last_logged >= step or (self.total and self.n >= self.total):
+            self._last_logged = self.n
+            total = self.total if self.total is not None else "?"
+            logger.info(f"{self.desc}: {self.n}/{total}")
+
+    def refresh(self):
+        pass
+
+    def close(self):
+        pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        return False
 
 
 def with_progress(desc=None, total=None):
     """
     Decorator to add a progress bar to a function.
+
+    When there is nothing to count, a no-op progress bar is substituted.
+    When stderr is not a terminal (CI logs, pipes) or NO_TQDM is set in
+    the environment, a logging counter replaces tqdm so progress is still
+    visible without per-update terminal rendering.
     """
 
     def decorator(func):
         @wraps(func)
         async def wrapper(*args, **kwargs):
-            if total is None:
-                # If total is None, don't use a progress bar
-                return await func(*args, **kwargs)
-
-            pbar = tqdm(total=total, desc=desc, unit="item")
+            if total == 0:
+                pbar = _NullPbar()
+            elif os.environ.get("NO_TQDM") or not sys.stderr.isatty():
+                pbar = _LogPbar(desc=desc, total=total)
+            else:
+                # Throttle rendering: concurrent update() calls otherwise
+                # spend more time formatting the bar than migrating
+                pbar = tqdm(
+                    total=total,
+                    desc=desc,
+                    unit="item",
+                    mininterval=0.25,
+                    miniters=max(1, total // 200) if total else 1,
+                )
             try:
                 result = await func(*args, **kwargs, pbar=pbar)
                 pbar.close()
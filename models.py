@@ -10,10 +10,12 @@ from sqlalchemy import (
     String,
     Table,
 )
-from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.orm import relationship
+from sqlalchemy.orm import DeclarativeBase, relationship
+
+
+class Base(DeclarativeBase):
+    pass
 
-Base = declarative_base()
 
 project_access = Table(
     "project_access",
@@ -124,14 +126,21 @@ class Story(Base):
 
     project = relationship("Project", back_populates="stories")
     requested_by = relationship("Person", foreign_keys=[requested_by_id])
+    # The migrators walk these collections for every story, so default to
+    # selectin loading: batched IN-queries instead of one SELECT per row.
     owners = relationship(
-        "Person", secondary=story_owner, back_populates="owned_stories"
+        "Person",
+        secondary=story_owner,
+        back_populates="owned_stories",
+        lazy="selectin",
+    )
+    labels = relationship(
+        "Label", secondary=story_label, back_populates="stories", lazy="selectin"
     )
-    labels = relationship("Label", secondary=story_label, back_populates="stories")
-    comments = relationship("Comment", back_populates="story")
-    blockers = relationship("Blocker", back_populates="story")
-    tasks = relationship("Task", back_populates="story")
-    iteration = relationship("Iteration", back_populates="stories")
+    comments = relationship("Comment", back_populates="story", lazy="selectin")
+    blockers = relationship("Blocker", back_populates="story", lazy="selectin")
+    tasks = relationship("Task", back_populates="story", lazy="selectin")
+    iteration = relationship("Iteration", back_populates="stories", lazy="selectin")
 
 
 class Label(Base):
@@ -158,7 +167,9 @@ class Comment(Base):
 
     story = relationship("Story", back_populates="comments")
     person = relationship("Person")
-    file_attachments = relationship("FileAttachment", back_populates="comment")
+    file_attachments = relationship(
+        "FileAttachment", back_populates="comment", lazy="selectin"
+    )
 
 
 class FileAttachment(Base):
@@ -201,7 +212,7 @@ class Blocker(Base):
     created_at = Column(DateTime, nullable=False)
     updated_at = Column(DateTime, nullable=False)
 
-    story = relationship("Story", back_populates="blockers")
+    story = relationship("Story", back_populates="blockers", lazy="selectin")
     person = relationship("Person")
 
 
@@ -216,6 +227,3 @@ class Task(Base):
     updated_at = Column(DateTime)
 
     story = relationship("Story", back_populates="tasks")
-
-
-tasks = relationship("Task", back_populates="story")